@@ -1,6 +1,9 @@
 """The main entry of the program."""
+import asyncio
 import os
+import signal
 import sys
+import typing
 from pathlib import Path
 
 if (nokari_path := str(Path(__file__).parent / "..")) not in sys.path:
@@ -10,13 +13,52 @@ if (nokari_path := str(Path(__file__).parent / "..")) not in sys.path:
 from nokari.core import Nokari, constants
 from nokari.utils import monkey_patch
 
-if os.name != "nt":
-    import uvloop  # pylint: disable=import-error
+REQUIRED_VARS: typing.Final[typing.Tuple[str, ...]] = ("DISCORD_BOT_TOKEN",)
+
+
+def _install_signal_handlers(bot: Nokari) -> None:
+    """Closes the bot on SIGINT and SIGTERM like GatewayBot.run does."""
+    loop = asyncio.get_running_loop()
+    closing: typing.Set[asyncio.Task[None]] = set()
+
+    def close() -> None:
+        if bot.is_alive and not closing:
+            # start and close are wrapped with functools.wraps, which makes
+            # mypy treat them as unbound.
+            closing.add(loop.create_task(bot.close()))  # type: ignore
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        if os.name == "nt":
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(close))
+        else:
+            loop.add_signal_handler(sig, close)
 
-    uvloop.install()
 
+async def main() -> None:
+    bot = Nokari()
+    _install_signal_handlers(bot)
+    await bot.start()  # type: ignore
+
+    try:
+        await bot.join()
+    finally:
+        if bot.is_alive:
+            await bot.close()  # type: ignore
+
+
+if missing := [var for var in REQUIRED_VARS if var not in os.environ]:
+    raise RuntimeError(f"Missing required env variables: {', '.join(missing)}")
 
 if browser := constants.DISCORD_BROWSER:
     monkey_patch.set_browser(constants.DISCORD_BROWSER)
 
-Nokari().run()
+if os.name == "nt":
+    asyncio.run(main())
+else:
+    import uvloop  # pylint: disable=import-error
+
+    if sys.version_info >= (3, 11) and hasattr(uvloop, "run"):
+        uvloop.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
@@ -7,11 +7,14 @@ import functools
 import importlib
 import logging
 import os
+import queue
+import re
 import shutil
 import sys
 import typing
 import weakref
 from contextlib import suppress
+from logging.handlers import QueueHandler, QueueListener
 
 import aiohttp
 import asyncpg
@@ -24,14 +27,14 @@ from hikari.messages import ButtonStyle
 from hikari.snowflakes import Snowflake
 from lightbulb import checks, commands
 from lightbulb.utils import maybe_await
-from lru import LRU  # pylint: disable=no-name-in-module
 
 from nokari.core import constants
 from nokari.core.cache import Cache
 from nokari.core.commands import command, group
 from nokari.core.context import Context
 from nokari.core.entity_factory import EntityFactory
-from nokari.utils import db, human_timedelta
+from nokari.utils import db, human_timedelta, plural
+from nokari.utils.caches import TwoQueueCache
 
 if typing.TYPE_CHECKING:
     from nokari.utils.paginator import Paginator
@@ -43,14 +46,45 @@ _CommandOrPluginT = typing.TypeVar(
 _LOGGER = logging.getLogger("nokari.core.bot")
 
 
-def _get_prefixes(bot: lightbulb.Bot, message: hikari.Message) -> typing.List[str]:
-    if not hasattr(bot, "prefixes"):
-        return bot.default_prefixes
+class _LocalQueueHandler(QueueHandler):
+    """
+    A QueueHandler for an in-process queue. The records are enqueued as is,
+    so the formatting is done by the listener's handlers instead of the loop.
+    """
 
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _get_prefixes(
+    bot: lightbulb.Bot, message: hikari.Message
+) -> typing.Tuple[str, ...]:
     prefixes = bot.prefixes
-    return prefixes.get(message.guild_id, bot.default_prefixes) + prefixes.get(
-        message.author.id, []
+    guild_prefixes = prefixes.get(message.guild_id, bot.default_prefixes)
+
+    if (user_prefixes := prefixes.get(message.author.id)) is None:
+        return guild_prefixes
+
+    return guild_prefixes + user_prefixes
+
+
+def _normalize_prefixes(prefixes: typing.Iterable[str]) -> typing.Tuple[str, ...]:
+    """Strips and dedupes the prefixes, sorted from the longest."""
+    return tuple(sorted({prefix.strip() for prefix in prefixes}, key=len, reverse=True))
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_prefixes(prefixes: typing.Tuple[str, ...]) -> typing.Pattern[str]:
+    """
+    Compiles the prefixes into a single case-insensitive pattern.
+    The longer prefixes come first so they take precedence, trailing whitespaces
+    are consumed as part of the prefix.
+    """
+    alternatives = "|".join(
+        re.escape(prefix)
+        for prefix in sorted(map(str.strip, prefixes), key=len, reverse=True)
     )
+    return re.compile(rf"(?:{alternatives})\s*", re.IGNORECASE)
 
 
 class Messageable(typing.Protocol):
@@ -83,6 +117,9 @@ class Nokari(lightbulb.Bot):
             logs=constants.LOG_LEVEL,
         )
 
+        # Move the log handlers off the event loop
+        self._log_listener = self._setup_logging()
+
         # Custom cache
         self._cache = self._event_manager._cache = Cache(
             self,
@@ -99,26 +136,31 @@ class Nokari(lightbulb.Bot):
         self._sync_ids: typing.Dict[Snowflake, str] = {}
 
         # Responses cache
-        self._resp_cache = LRU(1024)
+        self._resp_cache: TwoQueueCache[Snowflake, Snowflake] = TwoQueueCache(
+            maxsize=1024, kin=256, kout=512
+        )
 
         # Non-modular commands
-        _ = [
-            self.add_command(g)
-            for g in globals().values()
-            if isinstance(g, commands.Command)
-        ]
+        for cmd in _MODULE_COMMANDS:
+            self.add_command(cmd)
 
         # Set Launch time
         self.launch_time: datetime.datetime | None = None
 
         # Default prefixes
-        self.default_prefixes = ["nokari", "n!"]
+        self.default_prefixes: typing.Tuple[str, ...] = ("nokari", "n!")
 
         # Paginators
         self.paginators: typing.Mapping[
             Snowflake, Paginator
         ] = weakref.WeakValueDictionary()
 
+        # A mapping from guild and user ids to their prefixes
+        self.prefixes: typing.Dict[Snowflake, typing.Tuple[str, ...]] = {}
+
+        # Connection pool, this will be set on start if a DSN was provided
+        self._pool: asyncpg.Pool | None = None
+
     # pylint: disable=redefined-outer-name
     @functools.wraps(lightbulb.Bot._invoke_command)
     async def _invoke_command(
@@ -160,12 +202,42 @@ class Nokari(lightbulb.Bot):
         if utils := self.get_plugin("Utils"):
             utils.plugin_remove()
 
-        if self.pool:
+        if self.pool is not None:
+            _LOGGER.info(
+                "Closing pool with %s/%s connections (%s idle)",
+                self.pool.get_size(),
+                self.pool.get_max_size(),
+                self.pool.get_idle_size(),
+            )
             await self.pool.close()
-            delattr(self, "_pool")
+            self._pool = None
 
         await super().close(*args, **kwargs)
 
+        if (spotify_client := getattr(self, "spotify_client", None)) is not None:
+            spotify_client.close()
+
+        if self._log_listener is not None:
+            logging.getLogger().handlers = list(self._log_listener.handlers)
+            self._log_listener.stop()
+            self._log_listener = None
+
+    @staticmethod
+    def _setup_logging() -> QueueListener | None:
+        """
+        Replaces the root handlers with a QueueHandler, the actual handlers
+        will then be called by a QueueListener in a separate thread.
+        """
+        root = logging.getLogger()
+        if not root.handlers:
+            return None
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+        root.handlers = [_LocalQueueHandler(log_queue)]
+        listener.start()
+        return listener
+
     @property
     def default_color(self) -> hikari.Color:
         """Returns the dominant color of the bot's avatar."""
@@ -182,47 +254,58 @@ class Nokari(lightbulb.Bot):
         return self.rest._get_live_attributes().client_session
 
     @property
-    def responses_cache(self) -> LRU:
+    def responses_cache(self) -> TwoQueueCache[Snowflake, Snowflake]:
         """Returns a mapping from message IDs to its response message IDs."""
         return self._resp_cache
 
     @property
     def pool(self) -> asyncpg.Pool | None:
-        return getattr(self, "_pool", None)
+        return self._pool
 
     async def create_pool(self) -> None:
         """Creates a connection pool."""
-        if pool := await db.create_pool():
+        if pool := await db.create_pool(
+            min_size=4,
+            max_size=20,
+            max_inactive_connection_lifetime=300,
+            statement_cache_size=512,
+        ):
             self._pool = pool
 
     async def _load_prefixes(self) -> None:
-        if self.pool:
+        if self.pool is not None:
+            # Records iterate over their values, which are (hash, prefixes) pairs.
             self.prefixes = {
-                record["hash"]: record["prefixes"]
-                for record in await self.pool.fetch("SELECT * FROM prefixes")
+                hash_: _normalize_prefixes(prefixes)
+                for hash_, prefixes in await self.pool.fetch(
+                    "SELECT hash, prefixes FROM prefixes"
+                )
             }
 
+    def update_prefixes(
+        self, prefixes: typing.Mapping[Snowflake, typing.Iterable[str]]
+    ) -> None:
+        """Updates the prefixes cache, the prefixes are normalized beforehand."""
+        self.prefixes.update(
+            {hash_: _normalize_prefixes(value) for hash_, value in prefixes.items()}
+        )
+
     async def _resolve_prefix(self, message: hikari.Message) -> str | None:
         """Case-insensitive prefix resolver."""
+        if message.content is None:
+            return None
+
         prefixes = await maybe_await(self.get_prefix, self, message)
 
         if isinstance(prefixes, str):
             prefixes = [prefixes]
 
-        prefixes.sort(key=len, reverse=True)
-
-        if message.content is not None:
-            lowered_content = message.content.lower()
-            content_length = len(lowered_content)
-            for prefix in prefixes:
-                prefix = prefix.strip()
-                if lowered_content.startswith(prefix):
-                    while (prefix_length := len(prefix)) < content_length and (
-                        next_char := lowered_content[prefix_length : prefix_length + 1]
-                    ).isspace():
-                        prefix += next_char
-                        continue
-                    return prefix
+        if not prefixes:
+            return None
+
+        if match := _compile_prefixes(tuple(prefixes)).match(message.content):
+            return match.group()
+
         return None
 
     def get_context(
@@ -235,10 +318,11 @@ class Nokari(lightbulb.Bot):
         """Gets custom Context object."""
         return Context(self, message, prefix, invoked_with, invoked_command)
 
-    @property
-    def raw_plugins(self) -> typing.Iterator[str]:
+    @functools.cached_property
+    def raw_plugins(self) -> typing.Tuple[str, ...]:
         """
         Returns the plugins' path component.
+        The result is cached, call invalidate_plugins() to rediscover them.
 
         I can actually do the following:
             return (
@@ -248,7 +332,7 @@ class Nokari(lightbulb.Bot):
 
         Though, I found os.walk() is ~57%–70% faster (it shouldn't matter, but w/e.)
         """
-        return (
+        return tuple(
             f"{path.strip('/').replace('/', '.')}.{file[:-3]}"
             for path, _, files in os.walk("nokari/plugins/")
             for file in files
@@ -257,6 +341,10 @@ class Nokari(lightbulb.Bot):
             and not file.startswith("_")
         )
 
+    def invalidate_plugins(self) -> None:
+        """Clears the cached plugins so they'll be rediscovered on next access."""
+        self.__dict__.pop("raw_plugins", None)
+
     @property
     def brief_uptime(self) -> str:
         """Returns formatted brief uptime."""
@@ -366,6 +454,9 @@ class Nokari(lightbulb.Bot):
 @group(name="reload")
 async def reload_plugin(ctx: Context, *, plugins: str = "*") -> None:
     """Reloads certain or all the plugins."""
+    if plugins in ("all", "*"):
+        ctx.bot.invalidate_plugins()
+
     await ctx.execute_plugins(ctx.bot.reload_extension, plugins)
 
 
@@ -380,14 +471,44 @@ async def unload_plugin(ctx: Context, *, plugins: str = "*") -> None:
 @command(name="load")
 async def load_plugin(ctx: Context, *, plugins: str = "*") -> None:
     """Loads certain or all the plugins."""
+    if plugins in ("all", "*"):
+        ctx.bot.invalidate_plugins()
+
     await ctx.execute_plugins(ctx.bot.load_extension, plugins)
 
 
+@lightbulb.check(checks.owner_only)
+@command(name="respcache")
+async def responses_cache_stats(
+    ctx: Context, size: typing.Optional[int] = None
+) -> None:
+    """
+    Displays the hit ratio of the responses cache lookups on edited messages,
+    resizes the cache if size was passed.
+    """
+    resp_cache = ctx.bot.responses_cache
+
+    if size is not None:
+        if size < 1:
+            await ctx.respond("The size must be a positive integer.")
+            return
+
+        resp_cache.set_size(size)
+
+    hits, misses = resp_cache.get_stats()
+    ratio = hits / total * 100 if (total := hits + misses) else 0
+    await ctx.respond(
+        f"{len(resp_cache):,}/{resp_cache.get_size():,} entries | "
+        f"{plural(hits):hit,} & {plural(misses):miss|misses,} ({ratio:.2f}%)"
+    )
+
+
 @reload_plugin.command(name="module")
 async def reload_module(ctx: Context, *, modules: str) -> None:
     """Hot-reload modules."""
     modules = set(modules.split())
-    failed = set()
+    failed_pairs = []
+    failed_mods = set()
     parents = set()
     for mod in modules:
         parents.add(".".join(mod.split(".")[:-1]))
@@ -396,7 +517,8 @@ async def reload_module(ctx: Context, *, modules: str) -> None:
             importlib.reload(module)
         except Exception as e:  # pylint: disable=broad-except
             _LOGGER.error("Failed to reload %s", mod, exc_info=e)
-            failed.add((mod, e.__class__.__name__))
+            failed_pairs.append((mod, e.__class__.__name__))
+            failed_mods.add(mod)
 
     for parent in parents:
         parent_split = parent.split(".")
@@ -407,11 +529,21 @@ async def reload_module(ctx: Context, *, modules: str) -> None:
             except Exception as e:  # pylint: disable=broad-except
                 _LOGGER.error("Failed to reload parent %s", parent, exc_info=e)
 
-    loaded = "\n".join(f"+ {i}" for i in modules ^ {x[0] for x in failed})
-    failed = "\n".join(f"- {m} {e}" for m, e in failed)
+    loaded = "\n".join(f"+ {m}" for m in modules - failed_mods)
+    failed = "\n".join(f"- {m} {e}" for m, e in failed_pairs)
     await ctx.respond(f"```diff\n{loaded}\n{failed}```")
 
 
+_MODULE_COMMANDS: typing.Final[typing.List[commands.Command]] = [
+    reload_plugin,
+    unload_plugin,
+    load_plugin,
+    responses_cache_stats,
+    # also registered as a top-level command, like the old globals() scan did
+    reload_module,
+]
+
+
 def requires_db(command_or_plugin: _CommandOrPluginT) -> _CommandOrPluginT:
     if isinstance(command_or_plugin, commands.Command):
         command_or_plugin.disabled = True
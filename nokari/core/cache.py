@@ -8,7 +8,7 @@ from hikari.impl.cache import CacheImpl
 from hikari.internal import cache
 from lightbulb import utils
 
-from nokari.utils import converters
+from nokari.utils import converters, perms
 
 if typing.TYPE_CHECKING:
     from nokari.core.bot import Nokari
@@ -92,6 +92,33 @@ class Cache(CacheImpl):
 
         return super().delete_member(guild, user)
 
+    def set_role(self, role: guilds.Role, /) -> None:
+        super().set_role(role)
+
+        # Missing tables are built from the cached roles when they're needed.
+        if (role_perms := perms._role_perms.get(role.guild_id)) is not None:
+            role_perms[role.id] = int(role.permissions)
+
+    def delete_role(
+        self, role: snowflakes.SnowflakeishOr[guilds.PartialRole], /
+    ) -> typing.Optional[guilds.Role]:
+        if (deleted := super().delete_role(role)) is not None and (
+            role_perms := perms._role_perms.get(deleted.guild_id)
+        ) is not None:
+            role_perms.pop(deleted.id, None)
+
+        return deleted
+
+    def clear_roles_for_guild(
+        self, guild: snowflakes.SnowflakeishOr[guilds.PartialGuild], /
+    ) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        perms._role_perms.pop(snowflakes.Snowflake(guild), None)
+        return super().clear_roles_for_guild(guild)
+
+    def clear_roles(self) -> cache.CacheView[snowflakes.Snowflake, guilds.Role]:
+        perms._role_perms.clear()
+        return super().clear_roles()
+
     def _set_member(
         self, member: guilds.Member, /, *, is_reference: bool = True
     ) -> cache.RefCell[cache.MemberData]:
@@ -20,19 +20,33 @@ def format_(s_: str, fmt: FieldType) -> str:
     return f"[{s_}]"
 
 
-BASE = "name|id|mention"
-
-types = ["user", "member", "role", "channel"]
-
-for t in types:
-    constant = t.upper()
-    globals()[constant] = base = f"{t} {BASE}"
-    globals()[f"{constant}_REQUIRED"] = format_(base, FieldType.req)
-    globals()[f"{constant}_OPTIONAL"] = format_(base, FieldType.opt)
-    constant_with_caret = f"{constant}_CARET"
-    globals()[constant_with_caret] = base = f"{base}|^"
-    globals()[f"{constant_with_caret}_REQUIRED"] = format_(base, FieldType.req)
-    globals()[f"{constant_with_caret}_OPTIONAL"] = format_(base, FieldType.opt)
+USER = "user name|id|mention"
+USER_REQUIRED = "<user name|id|mention>"
+USER_OPTIONAL = "[user name|id|mention]"
+USER_CARET = "user name|id|mention|^"
+USER_CARET_REQUIRED = "<user name|id|mention|^>"
+USER_CARET_OPTIONAL = "[user name|id|mention|^]"
+
+MEMBER = "member name|id|mention"
+MEMBER_REQUIRED = "<member name|id|mention>"
+MEMBER_OPTIONAL = "[member name|id|mention]"
+MEMBER_CARET = "member name|id|mention|^"
+MEMBER_CARET_REQUIRED = "<member name|id|mention|^>"
+MEMBER_CARET_OPTIONAL = "[member name|id|mention|^]"
+
+ROLE = "role name|id|mention"
+ROLE_REQUIRED = "<role name|id|mention>"
+ROLE_OPTIONAL = "[role name|id|mention]"
+ROLE_CARET = "role name|id|mention|^"
+ROLE_CARET_REQUIRED = "<role name|id|mention|^>"
+ROLE_CARET_OPTIONAL = "[role name|id|mention|^]"
+
+CHANNEL = "channel name|id|mention"
+CHANNEL_REQUIRED = "<channel name|id|mention>"
+CHANNEL_OPTIONAL = "[channel name|id|mention]"
+CHANNEL_CARET = "channel name|id|mention|^"
+CHANNEL_CARET_REQUIRED = "<channel name|id|mention|^>"
+CHANNEL_CARET_OPTIONAL = "[channel name|id|mention|^]"
 
 TEXT = "text"
 TEXT_REQUIRED = "<text>"
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import time
 import typing
 from types import SimpleNamespace
@@ -20,6 +21,7 @@ if typing.TYPE_CHECKING:
 
 __all__: typing.Final[typing.List[str]] = ["Context"]
 _LOGGER = logging.getLogger("nokari.core.context")
+_FIRST_WORD = re.compile(r"\s*(\S+)")
 
 
 class Context(lightbulb.Context):
@@ -93,25 +95,27 @@ class Context(lightbulb.Context):
             )
             return self.interaction.message
 
-        if (
-            resp := self.bot.cache.get_message(
-                self.bot.responses_cache.get(self.message_id, 0)
-            )
-        ) is not None and self.edited_timestamp:
-            return await resp.edit(
-                content=content or None,
-                embed=embed or None,
-                attachment=attachment,
-                attachments=attachments,
-                component=component or None,
-                replace_attachments=True,
-                mentions_reply=mentions_reply,
-                mentions_everyone=mentions_everyone,
-                user_mentions=user_mentions,
-                role_mentions=role_mentions,
-            )
+        # Only edited messages can have a response, so new messages don't
+        # go through the cache lookup and skew its hit ratio.
+        if self.edited_timestamp:
+            if (
+                resp := self.bot.cache.get_message(
+                    self.bot.responses_cache.get(self.message_id, 0)
+                )
+            ) is not None:
+                return await resp.edit(
+                    content=content or None,
+                    embed=embed or None,
+                    attachment=attachment,
+                    attachments=attachments,
+                    component=component or None,
+                    replace_attachments=True,
+                    mentions_reply=mentions_reply,
+                    mentions_everyone=mentions_everyone,
+                    user_mentions=user_mentions,
+                    role_mentions=role_mentions,
+                )
 
-        if resp is None:
             self.bot.responses_cache.pop(self.message_id, None)
 
         resp = await super().respond(
@@ -179,6 +183,16 @@ class Context(lightbulb.Context):
         failed = "\n".join(f"- {c} {e}" for c, e in sorted(failed, key=key))
         return self.respond(f"```diff\n{loaded}\n{failed}```")
 
+    @property
+    def invoked_subcommand_name(self) -> typing.Optional[str]:
+        """Returns the name the subcommand was invoked with if any."""
+        if match := _FIRST_WORD.match(
+            self.content, len(self.prefix) + len(self.invoked_with)
+        ):
+            return match.group(1)
+
+        return None
+
     @property
     def color(self) -> hikari.Colour:
         """
@@ -3,7 +3,7 @@ import operator
 import os
 import types
 import typing
-from functools import partial
+from functools import lru_cache, partial
 from io import BytesIO
 
 import hikari
@@ -30,6 +30,28 @@ from nokari.utils.spotify import (
     Track,
 )
 
+_AUDIO_ATTRS: typing.Final[typing.Tuple[str, ...]] = (
+    "danceability",
+    "energy",
+    "speechiness",
+    "acousticness",
+    "instrumentalness",
+    "liveness",
+    "valence",
+)
+_AUDIO_ATTR_LABELS: typing.Final[typing.Tuple[str, ...]] = tuple(
+    attr.capitalize() for attr in _AUDIO_ATTRS
+)
+_AUDIO_ATTRS_GETTER: typing.Final[
+    typing.Callable[[typing.Any], typing.Tuple[float, ...]]
+] = operator.attrgetter(*_AUDIO_ATTRS)
+
+
+@lru_cache(maxsize=4096)
+def _format_duration(duration_ms: int) -> str:
+    """Formats the track duration, cached as the same tracks get looked up a lot."""
+    return get_timestamp(datetime.timedelta(milliseconds=duration_ms))
+
 
 class API(plugins.Plugin):
     """A plugin that utilizes external APIs."""
@@ -48,6 +70,12 @@ class API(plugins.Plugin):
         "SPOTIPY_CLIENT_ID",
         "SPOTIPY_CLIENT_SECRET",
     )
+    _STYLE_MAP: typing.ClassVar[typing.Dict[str, str]] = {
+        "dynamic": "1",
+        "fixed": "2",
+        "1": "1",
+        "2": "2",
+    }
 
     def __init__(self, bot: Bot) -> None:
         super().__init__()
@@ -70,33 +98,26 @@ class API(plugins.Plugin):
         *,
         data: typing.Union[hikari.Member, Track],
     ) -> None:
-        style_map = {
-            "dynamic": "1",
-            "fixed": "2",
-            **{s: s for n in range(1, 3) if (s := str(n))},
-        }
-        style = style_map.get(args.style, "2")
+        style = self._STYLE_MAP.get(args.style, "2")
 
         async with self.bot.rest.trigger_typing(ctx.channel_id):
-            with BytesIO() as fp:
-                await self.spotify_client(
-                    fp,
-                    data,
-                    args.hidden,
-                    args.color,
-                    style,
-                )
+            card = await self.spotify_client(
+                data,
+                args.hidden,
+                args.color,
+                style,
+            )
 
-                kwargs: typing.Dict[str, typing.Any] = {
-                    "attachment": hikari.Bytes(fp, f"{data}-card.png")
-                }
+            kwargs: typing.Dict[str, typing.Any] = {
+                "attachment": hikari.Bytes(card, f"{data}-card.png")
+            }
 
-                # if random.randint(0, 101) < 25:
-                #     kwargs["content"] = (
-                #         kwargs.get("content") or ""
-                #     ) + "\n\nHave you tried the slash version of this command?"
+            # if random.randint(0, 101) < 25:
+            #     kwargs["content"] = (
+            #         kwargs.get("content") or ""
+            #     ) + "\n\nHave you tried the slash version of this command?"
 
-                await ctx.respond(**kwargs)
+            await ctx.respond(**kwargs)
 
     # pylint: disable=no-self-use
     @utils.checks.require_env(*_spotify_vars)
@@ -165,11 +186,7 @@ class API(plugins.Plugin):
         spotify_code_url = data.get_code_url(hikari.Color.from_rgb(*colors[0]))
         spotify_code = await self.spotify_client._get_spotify_code(spotify_code_url)
 
-        invoked_with = (
-            ctx.content[len(ctx.prefix) + len(ctx.invoked_with) :]
-            .strip()
-            .split(maxsplit=1)[0]
-        )
+        invoked_with = ctx.invoked_subcommand_name or ctx.command.name
         embed = (
             hikari.Embed(
                 title=f"{invoked_with.capitalize()} Info",
@@ -182,14 +199,10 @@ class API(plugins.Plugin):
             .set_image(spotify_code)
         )
 
-        round_ = lambda n: int(round(n))
-
         for k, v in {
             "Key": audio_features.get_key(),
-            "Tempo": f"{round_(audio_features.tempo)} BPM",
-            "Duration": get_timestamp(
-                datetime.timedelta(seconds=audio_features.duration_ms / 1000)
-            ),
+            "Tempo": f"{int(audio_features.tempo + 0.5)} BPM",
+            "Duration": _format_duration(audio_features.duration_ms),
             "Camelot": audio_features.get_camelot(),
             "Loudness": f"{round(audio_features.loudness, 1)} dB",
             "Time Signature": f"{audio_features.time_signature}/4",
@@ -198,20 +211,10 @@ class API(plugins.Plugin):
         }.items():
             embed.add_field(name=k, value=v, inline=True)
 
-        for attr in (
-            "danceability",
-            "energy",
-            "speechiness",
-            "acousticness",
-            "instrumentalness",
-            "liveness",
-            "valence",
+        for label, value in zip(
+            _AUDIO_ATTR_LABELS, _AUDIO_ATTRS_GETTER(audio_features)
         ):
-            embed.add_field(
-                name=attr.capitalize(),
-                value=str(round_(getattr(audio_features, attr) * 100)),
-                inline=True,
-            )
+            embed.add_field(name=label, value=str(int(value * 100 + 0.5)), inline=True)
 
         kwargs: typing.Dict[str, typing.Any] = dict(embed=embed)
         await ctx.respond(**kwargs)
@@ -67,14 +67,9 @@ class Config(plugins.Plugin):
         )
         SELECT hash, prefixes FROM PREFIXES
         """
-        prefixes = {
-            record["hash"]: record["prefixes"]
-            for record in await self.bot.pool.fetch(
-                query, [ctx.guild_id, ctx.author.id]
-            )
-        }
+        prefixes = dict(await self.bot.pool.fetch(query, [ctx.guild_id, ctx.author.id]))
 
-        self.bot.prefixes.update(prefixes)
+        self.bot.update_prefixes(prefixes)
 
         if not prefixes.get(ctx.guild_id):
             self.bot.prefixes.pop(ctx.guild_id, None)
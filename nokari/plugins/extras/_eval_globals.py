@@ -1,4 +1,6 @@
 # pylint: disable=unused-import
+import re
+
 import hikari
 import lightbulb
 
@@ -1,8 +1,9 @@
 import ast
 import asyncio
+import functools
 import importlib
+import linecache
 import os
-import re
 import subprocess
 import sys
 import time
@@ -11,7 +12,7 @@ import typing
 from contextlib import redirect_stdout, suppress
 from inspect import getsource
 from io import StringIO
-from types import TracebackType
+from types import CodeType, TracebackType
 
 from lightbulb import Bot, checks, plugins
 
@@ -20,6 +21,37 @@ from nokari.core import Context
 from nokari.plugins.extras._eval_globals import *  # pylint: disable=wildcard-import,unused-wildcard-import
 
 ZWS_ACUTE = "\u200b`"
+NO_RETURN_FLAGS = ("-nr", "--no-return")
+_Body = typing.Union[typing.List[ast.AST], typing.List[ast.stmt]]
+
+
+def _wrap_expr(body: _Body) -> None:
+    body[-1] = ast.Return(body[-1].value)  # type: ignore
+    ast.fix_missing_locations(body[-1])
+
+
+def _descend_if(body: _Body) -> None:
+    Admin.insert_returns(body[-1].body)  # type: ignore
+    Admin.insert_returns(body[-1].orelse)  # type: ignore
+
+
+def _descend_with(body: _Body) -> None:
+    Admin.insert_returns(body[-1].body)  # type: ignore
+
+
+def _search_dir(obj: typing.Any, query: str) -> typing.List[str]:
+    query = query.lower()
+    return [i for i in dir(obj) if query in i]
+
+
+_TAIL_HANDLERS: typing.Final[
+    typing.Dict[typing.Type[ast.AST], typing.Callable[[_Body], None]]
+] = {
+    ast.Expr: _wrap_expr,
+    ast.If: _descend_if,
+    ast.With: _descend_with,
+    ast.AsyncWith: _descend_with,
+}
 
 
 class Admin(plugins.Plugin):
@@ -28,29 +60,19 @@ class Admin(plugins.Plugin):
     def __init__(self, bot: Bot):
         super().__init__()
         self.bot = bot
+        self._eval_base: typing.Dict[str, typing.Any] = {
+            "sauce": getsource,
+            "reload": importlib.reload,
+            "s_dir": _search_dir,
+            **globals(),
+        }
 
     @staticmethod
-    def insert_returns(
-        body: typing.Union[typing.List[ast.AST], typing.List[ast.stmt]]
-    ) -> None:
+    def insert_returns(body: _Body) -> None:
         """A static method that prepends a return statement at the last expression."""
 
-        if not body:
-            return
-
-        if isinstance(body[-1], ast.Expr):
-            body[-1] = ast.Return(body[-1].value)
-            ast.fix_missing_locations(body[-1])
-
-        if isinstance(body[-1], ast.If):
-            Admin.insert_returns(body[-1].body)
-            Admin.insert_returns(body[-1].orelse)
-
-        if isinstance(body[-1], ast.With):
-            Admin.insert_returns(body[-1].body)
-
-        if isinstance(body[-1], ast.AsyncWith):
-            Admin.insert_returns(body[-1].body)
+        if body and (handler := _TAIL_HANDLERS.get(type(body[-1]))):
+            handler(body)
 
     @staticmethod
     def clean_code(code: str) -> typing.Tuple[typing.List[str], ast.AST, bool, str]:
@@ -60,13 +82,10 @@ class Admin(plugins.Plugin):
             code = code[3:]
 
         status = False
-        while (code := code.rstrip("` \n")).endswith("-nr"):
-            code = code[:-3]
-            status = True
-
-        while (code := code.rstrip("` \n")).endswith("--no-return"):
-            code = code[:-11]
+        while (code := code.rstrip("` \n")).endswith(NO_RETURN_FLAGS):
             status = True
+            for flag in NO_RETURN_FLAGS:
+                code = code.removesuffix(flag)
 
         fn_name = "run_code"
         cmd = "\n".join(f"    {i}" for i in code.splitlines())
@@ -81,6 +100,20 @@ class Admin(plugins.Plugin):
 
         return raw.splitlines(), parsed, status, fn_name
 
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def compile_code(
+        code: str, filename: str
+    ) -> typing.Tuple[typing.List[str], CodeType, bool, str]:
+        """Cleans and compiles the code, the result is cached for repeated evals."""
+        raw_lines, parsed, status, fn_name = Admin.clean_code(code)
+        return (
+            raw_lines,
+            compile(parsed, filename=filename, mode="exec"),
+            status,
+            fn_name,
+        )
+
     @staticmethod
     def format_exc(
         exc_info: typing.Tuple[
@@ -92,17 +125,38 @@ class Admin(plugins.Plugin):
         filename: str,
     ) -> str:
         """
-        This is rather a hacky way to insert the line source.
+        Formats the exception with the eval source lines. The source is
+        registered to linecache so the frames pick them up when extracted.
         """
-        stack = traceback.format_exception(*exc_info)
-        assert len(stack) >= 3
-        stack.pop(1)  # the eval function call
-        for idx, frame in enumerate(stack):
-            if match := re.match(fr'\s+File "{filename}", line (?P<lineno>\d+)', frame):
-                lineno = int(match.group("lineno"))
-                stack[idx] += f"    {raw_lines[lineno-1].lstrip()}\n"
+        linecache.cache[filename] = (
+            sum(map(len, raw_lines)),
+            None,
+            [f"{line}\n" for line in raw_lines],
+            filename,
+        )
+        exc_type, exc_value, tb = exc_info
+        # Start from the next frame to skip the eval function call.
+        exc = traceback.TracebackException(
+            exc_type, exc_value, tb and tb.tb_next  # type: ignore
+        )
+        return "".join(exc.format()).strip()
+
+    @staticmethod
+    def iter_eval_chunks(
+        output: str, error: str, retval: str, append_retval: bool, max_char: int
+    ) -> typing.Iterator[typing.Tuple[str, str]]:
+        """Lazily yields the chunked outputs along with their labels."""
+        if output:
+            for text in utils.chunk(output.strip(), max_char):
+                yield "Standard Output", text
+
+        if error:
+            for text in utils.chunk(error.strip(), max_char):
+                yield "Standard Error", text
 
-        return "".join(stack).strip()
+        if append_retval:
+            for text in utils.chunk(retval, max_char):
+                yield "Return Value", text
 
     # pylint: disable=too-many-locals,too-many-arguments
     @staticmethod
@@ -114,60 +168,50 @@ class Admin(plugins.Plugin):
         measured_time: str,
         max_char: int,
     ) -> typing.Optional[typing.List[str]]:
-        fmt_output = f"Standard Output: ```py\n{output} ```\n" if output else ""
-        fmt_output += f"Standard Error: ```py\n{error} ```\n" if error else ""
-
         append_retval = not (hide_retval or error)
+        sections = [
+            (label, text, end)
+            for label, text, end, include in (
+                ("Standard Output", output, " ", output),
+                ("Standard Error", error, " ", error),
+                ("Return Value", retval, "", append_retval),
+            )
+            if include
+        ]
 
-        if append_retval:
-            fmt_output += f"Return Value: ```py\n{retval}```\n"
-
-        if not fmt_output:
+        if not sections:
             return None
 
-        if len(fmt_output) < max_char:
-            return [f"{fmt_output}{measured_time}"]
-
-        chunked_output = list(utils.chunk(output.strip(), max_char)) if output else []
-        chunked_error = list(utils.chunk(error.strip(), max_char)) if error else []
-
-        stdout_end = len(chunked_output) - 1
-        stderr_end = stdout_end + len(chunked_error)
-
-        texts = chunked_output + chunked_error
-
-        if append_retval:
-            texts += list(utils.chunk(retval, max_char))
-
-        pages = []
-
-        for idx, page in enumerate(texts):
-            if chunked_output and idx <= stdout_end:
-                fmt = "Standard Output: {page}"
-            elif chunked_error and idx <= stderr_end:
-                fmt = "Standard Error: {page}"
-            else:
-                fmt = "Return Value: {page}"
-
-            page = fmt.format(page=f"```py\n{page}```\n")
-            page = f"{page}{measured_time} | {idx + 1}/{len(texts)}"
-            pages.append(page)
+        # The length is computed upfront, so the combined output is only
+        # built when it fits in a single page. 12 is the length of the markup.
+        if (
+            sum(len(label) + len(text) + len(end) + 12 for label, text, end in sections)
+            < max_char
+        ):
+            return [
+                "".join(
+                    f"{label}: ```py\n{text}{end}```\n" for label, text, end in sections
+                )
+                + measured_time
+            ]
 
-        return pages
+        texts = list(
+            Admin.iter_eval_chunks(output, error, retval, append_retval, max_char)
+        )
+        total = len(texts)
+        return [
+            f"{label}: ```py\n{page}```\n{measured_time} | {idx}/{total}"
+            for idx, (label, page) in enumerate(texts, start=1)
+        ]
 
     # pylint: disable=exec-used,lost-exception,broad-except
     @lightbulb.check(checks.owner_only)
     @core.commands.command(name="eval")
     async def _eval(self, ctx: Context, *, cmd: str) -> None:
         """Evaluates Python script."""
-        env = {
-            "sauce": getsource,
-            "ctx": ctx,
-            "bot": ctx.bot,
-            "reload": importlib.reload,
-            "s_dir": lambda x, y: [i for i in dir(x) if y.lower() in i],
-            **globals(),
-        }
+        env = self._eval_base.copy()
+        env["ctx"] = ctx
+        env["bot"] = ctx.bot
 
         filename = "<eval>"
 
@@ -181,8 +225,8 @@ class Admin(plugins.Plugin):
         raw_lines = None
 
         try:
-            raw_lines, parsed, status, fn_name = self.clean_code(cmd)
-            exec(compile(parsed, filename=filename, mode="exec"), env)
+            raw_lines, code, status, fn_name = self.compile_code(cmd, filename)
+            exec(code, env)
             with redirect_stdout(stdout):
                 t0 = time.monotonic()
                 result = str(await env[fn_name]()).replace("`", ZWS_ACUTE)
@@ -209,12 +253,28 @@ class Admin(plugins.Plugin):
 
             await utils.Paginator.default(ctx, pages=pages).start()
 
+    @staticmethod
+    async def _drain(stream: typing.Optional[asyncio.StreamReader]) -> str:
+        """Reads the stream until EOF and decodes it once."""
+        if stream is None:
+            return ""
+
+        buffer = bytearray()
+        while chunk := await stream.read(65_536):
+            buffer.extend(chunk)
+
+        return buffer.decode(errors="replace")
+
     @staticmethod
     async def run_command_in_shell(command: str) -> typing.List[str]:
         process = await asyncio.create_subprocess_shell(
-            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, limit=1 << 20
+        )
+        outputs = await asyncio.gather(
+            Admin._drain(process.stdout), Admin._drain(process.stderr)
         )
-        return [output.decode() for output in await process.communicate()]
+        await process.wait()
+        return list(outputs)
 
     @lightbulb.check(checks.owner_only)
     @core.command(name="shell")
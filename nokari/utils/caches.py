@@ -4,12 +4,16 @@ Based on Danny a.k.a Rapptz's implementation.
 """
 import asyncio
 import typing
+from collections import OrderedDict
 from functools import wraps
 
 from lru import LRU  # pylint: disable=no-name-in-module
 
-__all__: typing.Final[typing.List[str]] = ["cache"]
+__all__: typing.Final[typing.List[str]] = ["cache", "TwoQueueCache"]
 _FuncT = typing.TypeVar("_FuncT", bound=typing.Callable[..., typing.Any])
+_KT = typing.TypeVar("_KT")
+_VT = typing.TypeVar("_VT")
+_MISSING: typing.Any = object()
 
 
 def _get_key(args: typing.Tuple[typing.Any, ...]) -> str:
@@ -63,3 +67,126 @@ def cache(size: int) -> typing.Callable[[_FuncT], _FuncT]:
         return typing.cast(_FuncT, wrapper)
 
     return decorator
+
+
+class TwoQueueCache(typing.Generic[_KT, _VT]):
+    """
+    A mapping with a 2Q replacement policy.
+
+    New keys land in a FIFO queue (A1in) and only get promoted to the
+    LRU queue (Am) if they're set again after being evicted from it,
+    which is tracked by the A1out ghost queue. This way one-off keys
+    don't flush out the frequently accessed ones like a plain LRU would.
+
+    The method names mirror lru.LRU so it can be used as a drop-in.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, maxsize: int, kin: int, kout: int) -> None:
+        if min(maxsize, kin, kout) < 1:
+            raise ValueError("maxsize, kin, and kout must be positive integers")
+
+        self._maxsize = maxsize
+        self._kin = kin
+        self._kout = kout
+        self._am: OrderedDict[_KT, _VT] = OrderedDict()
+        self._a1in: OrderedDict[_KT, _VT] = OrderedDict()
+        self._a1out: OrderedDict[_KT, None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._am) + len(self._a1in)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._am or key in self._a1in
+
+    def __getitem__(self, key: _KT) -> _VT:
+        if (value := self.get(key, _MISSING)) is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: _KT, value: _VT) -> None:
+        if key in self._am:
+            self._am[key] = value
+            self._am.move_to_end(key)
+            return
+
+        if key in self._a1in:
+            self._a1in[key] = value
+            return
+
+        self._reclaim()
+
+        if key in self._a1out:
+            del self._a1out[key]
+            self._am[key] = value
+            return
+
+        self._a1in[key] = value
+
+    def __delitem__(self, key: _KT) -> None:
+        if self.pop(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+    def _reclaim(self) -> None:
+        """Evicts entries until there's room for a new one."""
+        while len(self) >= self._maxsize:
+            if len(self._a1in) > self._kin or not self._am:
+                key, _ = self._a1in.popitem(last=False)
+                self._a1out[key] = None
+
+                if len(self._a1out) > self._kout:
+                    self._a1out.popitem(last=False)
+            else:
+                self._am.popitem(last=False)
+
+    def get(self, key: _KT, default: typing.Any = None) -> typing.Any:
+        if key in self._am:
+            self._am.move_to_end(key)
+            self.hits += 1
+            return self._am[key]
+
+        if key in self._a1in:
+            self.hits += 1
+            return self._a1in[key]
+
+        self.misses += 1
+        return default
+
+    def pop(self, key: _KT, default: typing.Any = None) -> typing.Any:
+        if key in self._am:
+            return self._am.pop(key)
+
+        return self._a1in.pop(key, default)
+
+    def clear(self) -> None:
+        self._am.clear()
+        self._a1in.clear()
+        self._a1out.clear()
+
+    def get_size(self) -> int:
+        return self._maxsize
+
+    def set_size(self, maxsize: int) -> None:
+        """Resizes the cache, scaling the queues proportionally."""
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self._kin = max(1, self._kin * maxsize // self._maxsize)
+        self._kout = max(1, self._kout * maxsize // self._maxsize)
+        self._maxsize = maxsize
+
+        while len(self) > maxsize:
+            if self._a1in:
+                self._a1in.popitem(last=False)
+            else:
+                self._am.popitem(last=False)
+
+        while len(self._a1out) > self._kout:
+            self._a1out.popitem(last=False)
+
+    def get_stats(self) -> typing.Tuple[int, int]:
+        """Returns the hits and misses count."""
+        return self.hits, self.misses
@@ -107,7 +107,10 @@ def create_tables(
 
 
 async def create_pool(
-    min_size: int = 3, max_size: int = 10, max_inactive_connection_lifetime: int = 60
+    min_size: int = 3,
+    max_size: int = 10,
+    max_inactive_connection_lifetime: int = 60,
+    statement_cache_size: int = 100,
 ) -> asyncpg.Pool | None:
     if not POSTGRESQL_DSN:
         return None
@@ -133,4 +136,5 @@ async def create_pool(
         min_size=min_size,
         max_size=max_size,
         max_inactive_connection_lifetime=max_inactive_connection_lifetime,
+        statement_cache_size=statement_cache_size,
     )
@@ -2,6 +2,7 @@
 
 import typing
 from functools import cache  # type: ignore
+from io import BytesIO
 
 import numexpr
 import numpy
@@ -13,6 +14,7 @@ __all__: typing.Final[typing.List[str]] = [
     "round_corners",
     "get_dominant_color",
     "right_fade",
+    "encode_png",
 ]
 
 
@@ -97,3 +99,13 @@ def right_fade(im: Image.Image, rad: int = 100) -> Image.Image:
         )
     )
     return im
+
+
+def encode_png(im: Image.Image) -> bytes:
+    """
+    Encodes the image into PNG bytes.
+    This is kept at module level so it can be run in a process pool.
+    """
+    with BytesIO() as fp:
+        im.save(fp, "PNG")
+        return fp.getvalue()
@@ -1,7 +1,7 @@
 """A module that contains helper functions for permissions checking."""
 
 import typing
-from functools import reduce, wraps
+from functools import wraps
 
 import hikari
 
@@ -14,51 +14,107 @@ __all__: typing.Final[typing.List[str]] = [
 ]
 FuncT = typing.TypeVar("FuncT", bound=typing.Callable[..., typing.Any])
 
+_ALL: typing.Final[hikari.Permissions] = hikari.Permissions.all_permissions()
+_ADMIN_INT: typing.Final[int] = int(hikari.Permissions.ADMINISTRATOR)
+_SEND: typing.Final[hikari.Permissions] = hikari.Permissions.SEND_MESSAGES
+_VIEW: typing.Final[hikari.Permissions] = hikari.Permissions.VIEW_CHANNEL
+# Permissions that are implicitly denied without the send messages permission.
+_SEND_MASK: typing.Final[hikari.Permissions] = (
+    hikari.Permissions.SEND_TTS_MESSAGES
+    | hikari.Permissions.MENTION_ROLES
+    | hikari.Permissions.EMBED_LINKS
+    | hikari.Permissions.ATTACH_FILES
+)
+# Permissions that are implicitly denied without the view channel permission.
+_VIEW_MASK: typing.Final[hikari.Permissions] = hikari.Permissions(
+    0b10110011111101111111111101010001
+)
 
-def _apply_overwrites(
-    perms: hikari.Permissions, allow: hikari.Permissions, deny: hikari.Permissions
-) -> hikari.Permissions:
-    """Applies overwrites to the permissions."""
-    return (perms & ~deny) | allow
+# Permissions that _ensure_perms may strip, or that decide whether it strips.
+_ENSURE_RELEVANT_MASK: typing.Final[int] = int(_SEND_MASK | _VIEW_MASK | _SEND | _VIEW)
+_ALL_INT: typing.Final[int] = int(_ALL)
+
+# A mapping from guild ids to their role ids and permissions. A guild's table is
+# built from the cached roles when it's missing, e.g. after a module reload, then
+# kept in sync by the cache so permission checks don't go through the Role objects.
+_role_perms: typing.Dict[hikari.Snowflake, typing.Dict[hikari.Snowflake, int]] = {}
+
+
+def _resolve_guild(bot: hikari.CacheAware, member: hikari.Member) -> hikari.Guild:
+    """Returns the guild object of the member from the cache."""
+    if (guild := bot.cache.get_guild(member.guild_id)) is None:
+        raise RuntimeError("Unable to get the Guild object")
+
+    return guild
 
 
 def _auto_resolve_guild(func: FuncT) -> FuncT:
     """A decorator that automatically resolves the guild object if it's None."""
 
-    @wraps(func)
-    def wrapped(*args: typing.Any) -> typing.Any:
-        if len(args) == func.__code__.co_argcount - 1:
-            args += (None,)
+    # The arity is resolved once here so the wrappers don't pack the arguments.
+    if func.__code__.co_argcount == 4:
 
-        if args[-1] is None:
-            bot, member, *_, guild = args
+        @wraps(func)
+        def wrapped_guild(
+            bot: hikari.CacheAware,
+            member: hikari.Member,
+            perms: hikari.Permissions,
+            guild: typing.Optional[hikari.Guild] = None,
+        ) -> typing.Any:
+            if guild is None:
+                guild = _resolve_guild(bot, member)
 
-            if (
-                guild is None
-                and (guild := bot.cache.get_guild(member.guild_id)) is None
-            ):
-                raise RuntimeError("Unable to get the Guild object")
+            return func(bot, member, perms, guild)
 
-            args = (bot, member, *_, guild)
+        return typing.cast(FuncT, wrapped_guild)
+
+    @wraps(func)
+    def wrapped_channel(
+        bot: hikari.CacheAware,
+        member: hikari.Member,
+        channel: hikari.GuildChannel,
+        perms: hikari.Permissions,
+        guild: typing.Optional[hikari.Guild] = None,
+    ) -> typing.Any:
+        if guild is None:
+            guild = _resolve_guild(bot, member)
 
-        return func(*args)
+        return func(bot, member, channel, perms, guild)
 
-    return typing.cast(FuncT, wrapped)
+    return typing.cast(FuncT, wrapped_channel)
 
 
 def _ensure_perms(perms: hikari.Permissions) -> hikari.Permissions:
     """Ensures the permissions."""
-    if perms & hikari.Permissions.ADMINISTRATOR:
-        return hikari.Permissions.all_permissions()
+    if perms & _ADMIN_INT:
+        return _ALL
 
-    if not perms & hikari.Permissions.SEND_MESSAGES:
-        perms &= ~hikari.Permissions.SEND_TTS_MESSAGES
-        perms &= ~hikari.Permissions.MENTION_ROLES
-        perms &= ~hikari.Permissions.EMBED_LINKS
-        perms &= ~hikari.Permissions.ATTACH_FILES
+    if not perms & _SEND:
+        perms &= ~_SEND_MASK
 
-    if not perms & hikari.Permissions.VIEW_CHANNEL:
-        perms.value &= ~hikari.Permissions(0b10110011111101111111111101010001)
+    if not perms & _VIEW:
+        perms &= ~_VIEW_MASK
+
+    return perms
+
+
+def _get_role_perms(guild: hikari.Guild) -> typing.Dict[hikari.Snowflake, int]:
+    """Returns the role permissions table of the guild, building it if needed."""
+    if (role_perms := _role_perms.get(guild.id)) is None:
+        role_perms = _role_perms[guild.id] = {
+            role_id: int(role.permissions)
+            for role_id, role in guild.get_roles().items()
+        }
+
+    return role_perms
+
+
+def _raw_guild_perms(guild: hikari.Guild, member: hikari.Member) -> int:
+    """Returns the combined permissions of the member's roles as an integer."""
+    get = _get_role_perms(guild).get
+    perms = get(guild.id, 0)
+    for role_id in member.role_ids:
+        perms |= get(role_id, 0)
 
     return perms
 
@@ -66,41 +122,48 @@ def _ensure_perms(perms: hikari.Permissions) -> hikari.Permissions:
 def get_guild_perms(guild: hikari.Guild, member: hikari.Member) -> hikari.Permissions:
     """Returns the guild-wide permissions of a member."""
     if guild.owner_id == member.id:
-        return hikari.Permissions.all_permissions()
-
-    return _ensure_perms(
-        reduce(
-            lambda acc, val: acc | val.permissions,
-            member.get_roles(),
-            hikari.Permissions(),
-        )
-    )
+        return _ALL
+
+    if (perms := _raw_guild_perms(guild, member)) & _ADMIN_INT:
+        return _ALL
+
+    return _ensure_perms(hikari.Permissions(perms))
 
 
 def get_channel_perms(
     guild: hikari.Guild, member: hikari.Member, channel: hikari.GuildChannel
 ) -> hikari.Permissions:
     """Returns the guild-wide permissions with channel overwrites applied."""
-    base = get_guild_perms(guild, member)
+    base = _apply_channel_overwrites(
+        guild, member, channel, int(get_guild_perms(guild, member))
+    )
+    return _ensure_perms(hikari.Permissions(base))
+
+
+def _apply_channel_overwrites(
+    guild: hikari.Guild, member: hikari.Member, channel: hikari.GuildChannel, base: int
+) -> int:
+    """Applies the channel overwrites to the permissions integer."""
+    get_overwrite = channel.permission_overwrites.get
 
-    if everyone := channel.permission_overwrites.get(guild.id):
-        base = _apply_overwrites(base, everyone.allow, everyone.deny)
+    if everyone := get_overwrite(guild.id):
+        base = (base & ~int(everyone.deny)) | int(everyone.allow)
 
-    allow = deny = hikari.Permissions()
+    allow = deny = 0
 
     for role_id in member.role_ids:
-        if (overwrite := channel.permission_overwrites.get(role_id)) is None:
+        if (overwrite := get_overwrite(role_id)) is None:
             continue
 
-        allow |= overwrite.allow
-        deny |= overwrite.deny
+        allow |= int(overwrite.allow)
+        deny |= int(overwrite.deny)
 
-    base = _apply_overwrites(base, allow, deny)
+    base = (base & ~deny) | allow
 
-    if (overwrite := channel.permission_overwrites.get(member.id)) is not None:
-        base = _apply_overwrites(base, overwrite.allow, overwrite.deny)
+    if (overwrite := get_overwrite(member.id)) is not None:
+        base = (base & ~int(overwrite.deny)) | int(overwrite.allow)
 
-    return _ensure_perms(base)
+    return base
 
 
 @_auto_resolve_guild
@@ -115,7 +178,16 @@ def has_guild_perms(
     This might be overriden by channel overwrites.
     """
     guild = typing.cast(hikari.Guild, guild)
-    return get_guild_perms(guild, member).all(perms)
+    if guild.owner_id == member.id:
+        return True
+
+    if perms & _ENSURE_RELEVANT_MASK:
+        return get_guild_perms(guild, member).all(perms)
+
+    # None of the requested permissions would be touched by _ensure_perms.
+    base = _raw_guild_perms(guild, member)
+    required = int(perms)
+    return bool(base & _ADMIN_INT) or base & required == required
 
 
 @_auto_resolve_guild
@@ -146,7 +218,19 @@ def has_channel_perms(
     and is allowed in the channel.
     """
     guild = typing.cast(hikari.Guild, guild)
-    return get_channel_perms(guild, member, channel).all(perms)
+    if guild.owner_id == member.id:
+        return True
+
+    if perms & _ENSURE_RELEVANT_MASK:
+        return get_channel_perms(guild, member, channel).all(perms)
+
+    # None of the requested permissions would be touched by _ensure_perms.
+    if (base := _raw_guild_perms(guild, member)) & _ADMIN_INT:
+        base = _ALL_INT
+
+    base = _apply_channel_overwrites(guild, member, channel, base)
+    required = int(perms)
+    return bool(base & _ADMIN_INT) or base & required == required
 
 
 @_auto_resolve_guild
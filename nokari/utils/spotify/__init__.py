@@ -20,12 +20,14 @@ from nokari.utils import algorithm, caches
 from nokari.utils.algorithm import get_alt_color, get_luminance
 from nokari.utils.formatter import get_timestamp as format_time
 from nokari.utils.images import (
+    encode_png,
     get_dominant_color,
     has_transparency,
     right_fade,
     round_corners,
 )
 
+from .batcher import SpotifyBatcher
 from .cache import SpotifyCache
 from .errors import LocalFilesDetected, NoSpotifyPresenceError
 from .rest import SpotifyRest
@@ -72,6 +74,11 @@ class SpotifyClient:
         self.bot = bot
         self.cache = SpotifyCache()
         self.rest = SpotifyRest()
+        self.audio_features_batcher = SpotifyBatcher(self.rest.audio_features)
+
+    def close(self) -> None:
+        """Stops the background tasks of the client."""
+        self.audio_features_batcher.close()
 
     @staticmethod
     def _get_timestamp(spotify: Spotify) -> typing.Tuple[str, str, float]:
@@ -600,19 +607,19 @@ class SpotifyClient:
 
     async def generate_spotify_card(
         self,
-        buffer: BytesIO,
         data: typing.Union[hikari.User, Track],
         hidden: bool,
         color_mode: str,
         style: str = "2",
-    ) -> None:
+    ) -> bytes:
+        """Generates the Spotify card and returns the PNG bytes."""
         func = f"_generate_base_card{style}"
         metadata = self._get_data(data)
         canvas, card_data = await getattr(self, func)(metadata, hidden, color_mode)
 
         if card_data is not None:
 
-            def wrapper() -> Image.Image:
+            def wrapper() -> bytes:
                 draw = ImageDraw.Draw(canvas)
                 width = canvas.size[0]
                 font_color, alt_color, height, timestamp = (
@@ -695,15 +702,13 @@ class SpotifyClient:
                         fill=alt_color,
                     )
 
-                return canvas
-
-            canvas = await self.bot.loop.run_in_executor(self.bot.executor, wrapper)
+                return encode_png(canvas)
 
-        def save() -> None:
-            canvas.save(buffer, "PNG")
-            buffer.seek(0)
+            return await self.bot.loop.run_in_executor(self.bot.executor, wrapper)
 
-        await self.bot.loop.run_in_executor(self.bot.executor, save)
+        return await self.bot.loop.run_in_executor(
+            self.bot.executor, encode_png, canvas
+        )
 
     __call__ = generate_spotify_card
 
@@ -923,7 +928,7 @@ class SpotifyClient:
         if audio_features:
             return audio_features
 
-        res = (await self.rest.audio_features([_id]))[0]
+        res = await self.audio_features_batcher.get(_id)
         audio_features = AudioFeatures.from_dict(self, res)
         self.cache.set_item(audio_features)
         return audio_features
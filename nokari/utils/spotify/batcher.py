@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import typing
+
+__all__: typing.Final[typing.List[str]] = ["SpotifyBatcher"]
+_Fetcher = typing.Callable[
+    [typing.List[str]], typing.Awaitable[typing.Sequence[typing.Any]]
+]
+
+
+class SpotifyBatcher:
+    """
+    Coalesces concurrent lookups by ID into a single request.
+
+    The first queued ID wakes the worker, which then waits for up to
+    `delay` seconds or until `max_size` IDs are queued before fetching
+    them all at once and resolving the futures.
+    """
+
+    def __init__(
+        self, fetch: _Fetcher, *, max_size: int = 100, delay: float = 0.02
+    ) -> None:
+        self._fetch = fetch
+        self._max_size = max_size
+        self._delay = delay
+        self._queue: asyncio.Queue[
+            typing.Tuple[str, asyncio.Future[typing.Any]]
+        ] = asyncio.Queue()
+        self._task: asyncio.Task[None] = asyncio.create_task(self._worker())
+
+    def close(self) -> None:
+        """Stops the worker and cancels the lookups that are still queued."""
+        self._task.cancel()
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+
+    def get(self, _id: str) -> asyncio.Future[typing.Any]:
+        """Queues the ID, the returned future resolves to its result."""
+        if self._task.done():
+            raise RuntimeError("The batcher has been closed")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((_id, future))
+        return future
+
+    async def _collect(
+        self,
+    ) -> typing.List[typing.Tuple[str, asyncio.Future[typing.Any]]]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._delay
+
+        while len(batch) < self._max_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            if (timeout := deadline - loop.time()) <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _worker(self) -> None:
+        while 1:
+            batch = await self._collect()
+            ids = list(dict.fromkeys(_id for _id, _ in batch))
+
+            try:
+                results = dict(zip(ids, await self._fetch(ids)))
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                raise
+            except Exception as e:  # pylint: disable=broad-except
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for _id, future in batch:
+                if not future.done():
+                    future.set_result(results.get(_id))
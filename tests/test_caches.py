@@ -0,0 +1,70 @@
+import pytest
+
+from nokari.utils.caches import TwoQueueCache
+
+
+@pytest.fixture
+def cache() -> TwoQueueCache[int, int]:
+    return TwoQueueCache(maxsize=4, kin=1, kout=2)
+
+
+def test_get_and_set(cache: TwoQueueCache[int, int]) -> None:
+    cache[1] = 10
+    assert cache.get(1) == 10
+    assert cache[1] == 10
+    assert cache.get(2) is None
+    assert cache.get_stats() == (2, 1)
+
+    with pytest.raises(KeyError):
+        cache[2]  # pylint: disable=pointless-statement
+
+
+def test_pop(cache: TwoQueueCache[int, int]) -> None:
+    cache[1] = 10
+    assert cache.pop(1) == 10
+    assert cache.pop(1, 0) == 0
+    assert 1 not in cache
+    assert not cache
+
+
+def test_size_is_bounded(cache: TwoQueueCache[int, int]) -> None:
+    for i in range(100):
+        cache[i] = i
+
+    assert len(cache) == cache.get_size() == 4
+
+
+def test_scan_resistance(cache: TwoQueueCache[int, int]) -> None:
+    for i in range(5):
+        cache[i] = i
+
+    # 0 was evicted to the ghost queue, setting it again promotes it.
+    assert 0 not in cache
+    cache[0] = 0
+
+    # a scan of one-off keys shouldn't flush the promoted key out.
+    for i in range(100, 200):
+        cache[i] = i
+
+    assert cache.get(0) == 0
+
+
+def test_set_size(cache: TwoQueueCache[int, int]) -> None:
+    for i in range(4):
+        cache[i] = i
+
+    cache.set_size(2)
+    assert len(cache) == cache.get_size() == 2
+
+
+def test_set_size_rejects_non_positive(cache: TwoQueueCache[int, int]) -> None:
+    with pytest.raises(ValueError):
+        cache.set_size(0)
+
+    # the queues still have room after shrinking to the smallest size.
+    cache.set_size(1)
+    cache.set_size(1024)
+    for i in range(10):
+        cache[i] = i
+
+    assert len(cache) == 10
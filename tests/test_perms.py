@@ -0,0 +1,100 @@
+import random
+import typing
+from types import SimpleNamespace
+
+import hikari
+import pytest
+
+from nokari.utils import perms
+
+GUILD_ID = hikari.Snowflake(1)
+OWNER_ID = hikari.Snowflake(2)
+MEMBER_ID = hikari.Snowflake(3)
+ROLE_IDS = [hikari.Snowflake(i) for i in range(10, 15)]
+ALL = int(hikari.Permissions.all_permissions())
+
+# Permissions that don't intersect the mask, so they take the raw int path.
+FAST_PATH_PERMS = [
+    hikari.Permissions.KICK_MEMBERS,
+    hikari.Permissions.BAN_MEMBERS,
+    hikari.Permissions.MANAGE_GUILD,
+    hikari.Permissions.KICK_MEMBERS | hikari.Permissions.BAN_MEMBERS,
+    hikari.Permissions.CHANGE_NICKNAME | hikari.Permissions.MANAGE_NICKNAMES,
+]
+
+
+def make_overwrite(rng: random.Random) -> SimpleNamespace:
+    return SimpleNamespace(
+        allow=hikari.Permissions(rng.getrandbits(ALL.bit_length()) & ALL),
+        deny=hikari.Permissions(rng.getrandbits(ALL.bit_length()) & ALL),
+    )
+
+
+def make_entities(seed: int) -> typing.Tuple[typing.Any, ...]:
+    rng = random.Random(seed)
+    roles = {
+        role_id: SimpleNamespace(
+            permissions=hikari.Permissions(rng.getrandbits(ALL.bit_length()) & ALL)
+        )
+        for role_id in (GUILD_ID, *ROLE_IDS)
+    }
+    guild = SimpleNamespace(id=GUILD_ID, owner_id=OWNER_ID, get_roles=lambda: roles)
+    member = SimpleNamespace(
+        id=MEMBER_ID,
+        guild_id=GUILD_ID,
+        role_ids=[GUILD_ID, *rng.sample(ROLE_IDS, rng.randint(0, len(ROLE_IDS)))],
+    )
+    channel = SimpleNamespace(
+        permission_overwrites={
+            key: make_overwrite(rng)
+            for key in (GUILD_ID, *ROLE_IDS, MEMBER_ID)
+            if rng.random() < 0.5
+        }
+    )
+    bot = SimpleNamespace(cache=SimpleNamespace(get_guild=lambda _: guild))
+    return bot, guild, member, channel
+
+
+@pytest.fixture(autouse=True)
+def role_perms(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(perms, "_role_perms", {})
+
+
+@pytest.mark.parametrize("seed", range(100))
+@pytest.mark.parametrize("flags", FAST_PATH_PERMS)
+def test_guild_fast_path(seed: int, flags: hikari.Permissions) -> None:
+    bot, guild, member, _ = make_entities(seed)
+    expected = perms.get_guild_perms(guild, member).all(flags)
+    assert perms.has_guild_perms(bot, member, flags) is expected
+
+
+@pytest.mark.parametrize("seed", range(100))
+@pytest.mark.parametrize("flags", FAST_PATH_PERMS)
+def test_channel_fast_path(seed: int, flags: hikari.Permissions) -> None:
+    bot, guild, member, channel = make_entities(seed)
+    expected = perms.get_channel_perms(guild, member, channel).all(flags)
+    assert perms.has_channel_perms(bot, member, channel, flags) is expected
+
+
+def test_role_perms_are_rebuilt() -> None:
+    bot, guild, member, _ = make_entities(0)
+    member.role_ids = [GUILD_ID, ROLE_IDS[0]]
+    guild.get_roles()[GUILD_ID].permissions = hikari.Permissions.NONE
+    guild.get_roles()[ROLE_IDS[0]].permissions = hikari.Permissions.KICK_MEMBERS
+
+    assert perms.has_guild_perms(bot, member, hikari.Permissions.KICK_MEMBERS)
+
+    # e.g. the module was reloaded, the table should be built from the roles again.
+    perms._role_perms.clear()
+    assert perms.has_guild_perms(bot, member, hikari.Permissions.KICK_MEMBERS)
+    assert not perms.has_guild_perms(bot, member, hikari.Permissions.BAN_MEMBERS)
+
+
+def test_owner_has_all_perms() -> None:
+    bot, guild, member, channel = make_entities(0)
+    member.id = OWNER_ID
+
+    assert perms.has_guild_perms(bot, member, hikari.Permissions.all_permissions())
+    assert perms.has_channel_perms(
+        bot, member, channel, hikari.Permissions.all_permissions()
+    )
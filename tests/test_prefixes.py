@@ -0,0 +1,29 @@
+import typing
+
+import pytest
+
+from nokari.core.bot import _compile_prefixes, _normalize_prefixes
+
+PREFIXES = _normalize_prefixes(("n!", "nokari", " n ", "<@1> "))
+
+
+@pytest.mark.parametrize(
+    "content, prefix",
+    [
+        ("n!help", "n!"),
+        ("N!help", "N!"),
+        ("NOKARI help", "NOKARI "),
+        ("nOkArI   \nhelp", "nOkArI   \n"),
+        ("n help", "n "),
+        ("<@1> help", "<@1> "),
+        ("help n!", None),
+        ("", None),
+    ],
+)
+def test_resolve_prefix(content: str, prefix: typing.Optional[str]) -> None:
+    match = _compile_prefixes(PREFIXES).match(content)
+    assert (match and match.group()) == prefix
+
+
+def test_normalize_prefixes() -> None:
+    assert _normalize_prefixes(["n!", " n! ", "nokari"]) == ("nokari", "n!")